@@ -1,46 +1,178 @@
 from flask import Flask, render_template, jsonify, request, abort
-import json
+from flask.json.provider import JSONProvider
+from flask_compress import Compress
+from datetime import datetime, timezone
+import hashlib
 import os
 from pathlib import Path
+import orjson
 from dotenv import load_dotenv
 
 # --- Configuration & Setup ---
-env_path = Path(__file__).parent / ".env"
+BASE_DIR = Path(__file__).parent
+DATA_DIR = BASE_DIR / "data"
+TEMPLATE_DIR = BASE_DIR / "templates"
+
+env_path = BASE_DIR / ".env"
 load_dotenv(dotenv_path=env_path)
 
 app = Flask(__name__, static_folder='static', template_folder='templates')
 
+# JSON Setup: jsonify() and |tojson go through orjson instead of the stdlib encoder
+class OrjsonProvider(JSONProvider):
+    def _encode(self, obj, default=None, sort_keys=False, **kwargs):
+        # Other stdlib kwargs (indent, separators...) have no orjson equivalent and are ignored
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, default=default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        return self._encode(obj, **kwargs).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Hand orjson's bytes to the response as-is, skipping a str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._encode(obj), mimetype='application/json')
+
+app.json = OrjsonProvider(app)
+# Rebind |tojson in case the Jinja env was created with the old provider's dumps
+app.jinja_env.policies['json.dumps_function'] = app.json.dumps
+
+# Compression Setup (Compress must be registered before add_header so it runs after it)
+class CompressedPageCache:
+    """Keeps compressed bodies of cached pages so each is gzipped/brotli'd once per process"""
+
+    def __init__(self):
+        self.blobs = {}
+
+    def _enabled(self):
+        return not app.debug and request.endpoint in CACHED_PAGES
+
+    def get(self, key):
+        return self.blobs.get(key) if self._enabled() else None
+
+    def set(self, key, value):
+        if self._enabled():
+            self.blobs[key] = value
+
+app.config['COMPRESS_MIMETYPES'] = ['text/html', 'application/json', 'text/css', 'application/javascript']
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 500
+app.config['COMPRESS_CACHE_BACKEND'] = CompressedPageCache
+app.config['COMPRESS_CACHE_KEY'] = lambda req: req.path
+Compress(app)
+
 # Cache Setup
-import time
 RESPONSE_CACHE_TTL = 3600 # 1 hour for static content
-JSON_CACHE = {}            # Global in-memory cache for JSON files
+API_CACHE_TTL = 60         # 1 minute for JSON API responses polled by the frontend
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = RESPONSE_CACHE_TTL  # /static keeps send_file's ETag/Last-Modified
+JSON_CACHE = {}            # Process-wide cache of every file under data/, filled at import
+JSON_ETAGS = {}            # Content hash of each cached file, for conditional API responses
+JSON_LAST_MODIFIED = {}    # mtime of each cached file, for Last-Modified on API responses
+PAGE_CACHE = {}            # Rendered HTML of data-only pages, keyed by endpoint
+CACHED_PAGES = frozenset({'home', 'courses_page', 'events_page', 'deals_page', 'team_page', 'partners_page', 'sponsors_page'})
 
 # --- Helper Functions ---
 
+def file_last_modified(path):
+    """A file's mtime as a UTC datetime truncated to HTTP-date (whole second) precision"""
+    return datetime.fromtimestamp(int(path.stat().st_mtime), tz=timezone.utc)
+
+def preload_json():
+    """Parse every JSON file under data/ once; malformed files fail the boot, not each request"""
+    for path in sorted(DATA_DIR.rglob('*.json')):
+        filepath = path.relative_to(BASE_DIR).as_posix()
+        raw = path.read_bytes()
+        data = orjson.loads(raw)
+        # Tuples keep shared data read-only across requests; slicing still works
+        JSON_CACHE[filepath] = tuple(data) if isinstance(data, list) else data
+        JSON_ETAGS[filepath] = hashlib.blake2b(raw, digest_size=8).hexdigest()
+        JSON_LAST_MODIFIED[filepath] = file_last_modified(path)
+
 def load_json(filepath):
-    # Check cache first
-    if filepath in JSON_CACHE:
-        return JSON_CACHE[filepath]
-        
-    try:
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        full_path = os.path.join(base_dir, filepath)
-        with open(full_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            JSON_CACHE[filepath] = data # Store in cache
-            return data
-    except Exception as e:
-        print(f"Error loading {filepath}: {e}")
-        return []
+    return JSON_CACHE.get(filepath, ())
+
+def content_files():
+    """Every file whose contents feed a cached page, including the view code in this module"""
+    return sorted([Path(__file__), *DATA_DIR.rglob('*.json'), *TEMPLATE_DIR.rglob('*.html')])
+
+def compute_content_etag():
+    """Hash the page inputs so page ETags change whenever any of them is redeployed"""
+    digest = hashlib.blake2b(digest_size=8)
+    for path in content_files():
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+def compute_content_last_modified():
+    """Newest mtime across the same page inputs the ETag hashes, so both validators move together"""
+    return max(file_last_modified(path) for path in content_files())
+
+def render_cached(template_name, **context):
+    """Render a page once per process; its inputs only change on redeploy"""
+    if app.debug:
+        return render_template(template_name, **context)
+    html = PAGE_CACHE.get(request.endpoint)
+    if html is None:
+        html = PAGE_CACHE[request.endpoint] = render_template(template_name, **context)
+    return html
+
+def matching_etag(etag):
+    """Find the client's copy of an ETag as (tag, is_weak); Compress may have suffixed it with ':gzip' etc."""
+    if_none_match = request.if_none_match
+    if if_none_match.star_tag:
+        return etag, False
+    # If-None-Match uses weak comparison, and proxies often weaken tags they recompress
+    for tag in if_none_match.as_set(include_weak=True):
+        if tag == etag or tag.startswith(f'{etag}:'):
+            return tag, if_none_match.is_weak(tag)
+    return None
+
+def unmodified_since(last_modified):
+    """Check If-Modified-Since, which only applies when the client sent no If-None-Match"""
+    since = request.if_modified_since
+    return not request.if_none_match and since is not None and since >= last_modified
+
+def not_modified(etag, weak=False):
+    """Build an empty 304 carrying the ETag the client already holds"""
+    response = app.response_class(status=304)
+    response.set_etag(etag, weak=weak)
+    return response
+
+preload_json()
+CONTENT_ETAG = compute_content_etag()
+CONTENT_LAST_MODIFIED = compute_content_last_modified()
 
 # --- Page Routes ---
 
+@app.before_request
+def short_circuit_not_modified():
+    """Answer revalidation of an unchanged page with a 304 before rendering its template"""
+    if app.debug or request.method not in ('GET', 'HEAD') or request.endpoint not in CACHED_PAGES:
+        return None
+    client_etag = matching_etag(CONTENT_ETAG)
+    if client_etag:
+        return not_modified(*client_etag)
+    if unmodified_since(CONTENT_LAST_MODIFIED):
+        return not_modified(CONTENT_ETAG)
+    return None
+
 @app.after_request
 def add_header(response):
-    """Add caching headers to static content and safe GET requests"""
-    if request.method == 'GET' and (request.path.startswith('/static') or request.endpoint in ['home', 'courses_page', 'events_page', 'deals_page', 'team_page', 'partners_page', 'sponsors_page']):
+    """Add caching headers to safe GET/HEAD requests for data-only pages and the events API"""
+    if request.method not in ('GET', 'HEAD'):
+        return response
+    if request.endpoint in CACHED_PAGES:
         response.cache_control.public = True
         response.cache_control.max_age = RESPONSE_CACHE_TTL
+        if not app.debug:
+            response.last_modified = CONTENT_LAST_MODIFIED
+            if response.status_code == 200:
+                response.set_etag(CONTENT_ETAG)
+    elif request.endpoint == 'get_events':
+        response.cache_control.public = True
+        response.cache_control.max_age = API_CACHE_TTL
     return response
 
 @app.route('/')
@@ -59,48 +191,48 @@ def home():
     deals = load_json('data/deals.json')[:2]
     team = load_json('data/team.json')[:4]
     
-    return render_template('index.html', 
-                           courses=courses, 
-                           events=events,
-                           ongoing=ongoing,
-                           deals=deals, 
-                           team=team,
-                           events_count=total_events)
+    return render_cached('index.html',
+                         courses=courses, 
+                         events=events,
+                         ongoing=ongoing,
+                         deals=deals, 
+                         team=team,
+                         events_count=total_events)
 
 @app.route('/courses')
 def courses_page():
     courses = load_json('data/courses.json')
-    return render_template('courses.html', courses=courses)
+    return render_cached('courses.html', courses=courses)
 
 @app.route('/events')
 def events_page():
     upcoming = load_json('data/events/upcoming.json')
     ongoing = load_json('data/events/ongoing.json')
     past = load_json('data/events/past.json')
-    return render_template('events.html', 
-                           upcoming=upcoming, 
-                           ongoing=ongoing, 
-                           past=past)
+    return render_cached('events.html',
+                         upcoming=upcoming,
+                         ongoing=ongoing,
+                         past=past)
 
 @app.route('/deals')
 def deals_page():
     deals = load_json('data/deals.json')
-    return render_template('deals.html', deals=deals)
+    return render_cached('deals.html', deals=deals)
 
 @app.route('/team')
 def team_page():
     team = load_json('data/team.json')
-    return render_template('team.html', team=team)
+    return render_cached('team.html', team=team)
 
 @app.route('/partners')
 def partners_page():
     partners = load_json('data/partners.json')
-    return render_template('partners.html', partners=partners)
+    return render_cached('partners.html', partners=partners)
 
 @app.route('/sponsors')
 def sponsors_page():
     sponsors = load_json('data/sponsors.json')
-    return render_template('sponsors.html', sponsors=sponsors)
+    return render_cached('sponsors.html', sponsors=sponsors)
 
 @app.route('/secret-id-gen')
 def id_generator():
@@ -114,8 +246,26 @@ def student_id_page():
 
 @app.route('/api/events/<event_type>')
 def get_events(event_type):
-    data = load_json(f'data/events/{event_type}.json')
-    return jsonify(data)
+    filepath = f'data/events/{event_type}.json'
+    etag = JSON_ETAGS.get(filepath)
+    if etag is None:
+        return jsonify(load_json(filepath))
+
+    last_modified = JSON_LAST_MODIFIED[filepath]
+    client_etag = matching_etag(etag)
+    if client_etag:
+        response = not_modified(*client_etag)
+    elif unmodified_since(last_modified):
+        response = not_modified(etag)
+    else:
+        response = jsonify(load_json(filepath))
+        response.set_etag(etag)
+    response.last_modified = last_modified
+    return response
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
+    # Development server only; production runs under gunicorn (see Procfile).
+    # Watching data/ makes the reloader restart on edits, which re-runs the preload.
+    app.run(debug=os.getenv('FLASK_DEBUG') == '1',
+            port=int(os.getenv('PORT', 5000)),
+            extra_files=[str(path) for path in DATA_DIR.rglob('*.json')])